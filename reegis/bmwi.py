@@ -64,11 +64,13 @@ def read_bmwi_sheet_7(sub):
 
     sheet = "7" + sub
 
+    # Open the workbook once and probe for the header row on the parsed file.
+    xls = pd.ExcelFile(filename)
     fs = pd.DataFrame()
     n = 4
     while 2014 not in fs.columns:
         n += 1
-        fs = pd.read_excel(filename, sheet, skiprows=n)
+        fs = xls.parse(sheet, skiprows=n)
 
     # Convert first column to string
     fs["Unnamed: 0"] = fs["Unnamed: 0"].apply(str)